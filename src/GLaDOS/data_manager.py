@@ -1,4 +1,4 @@
-from .error_handler import ErrorHandler
+from .error_handler import get_error_handler
 
 class DataManager:
     def __init__(self):
@@ -9,7 +9,7 @@ class DataManager:
             # Logic to save data
             pass
         except Exception as e:
-            ErrorHandler().handle_error(e, 'Error saving data')
+            get_error_handler().handle_error(e, 'Error saving data')
             # Optionally, re-raise the exception if it should not be silently handled
             raise
 
@@ -18,6 +18,6 @@ class DataManager:
             # Logic to retrieve data
             pass
         except Exception as e:
-            ErrorHandler().handle_error(e, 'Error retrieving data')
+            get_error_handler().handle_error(e, 'Error retrieving data')
             # Optionally, re-raise the exception if it should not be silently handled
             raise
@@ -1,3 +1,4 @@
+import functools
 import logging
 import sys
 
@@ -21,8 +22,19 @@ class ErrorHandler:
         self.logger.error(f'Error: {error}, Context: {context}')
         # TODO: Implement error reporting logic, e.g., send email, report to a monitoring system
 
+
+@functools.lru_cache(maxsize=None)
+def get_error_handler():
+    """
+    Returns the shared ErrorHandler.
+
+    Each ErrorHandler attaches a new stream handler to the 'error_logger'
+    logger, so creating one per error would duplicate every log line.
+    """
+    return ErrorHandler()
+
 # Example of use
-# error_handler = ErrorHandler()
+# error_handler = get_error_handler()
 # try:
 #     # Your code logic here
 #     pass
@@ -10,14 +10,17 @@ class EventBus:
         self.min_interval = min_interval
 
     def register_event(self, event_name, handler):
-        if event_name not in self.event_handlers:
-            self.event_handlers[event_name] = []
-            self.last_execution_time[event_name] = 0
-        self.event_handlers[event_name].append(handler)
+        handlers = self.event_handlers.get(event_name)
+        if handlers is None:
+            handlers = self.event_handlers[event_name] = []
+            self.last_execution_time[event_name] = float("-inf")
+        handlers.append(handler)
 
     def emit_event(self, event_name, *args, **kwargs):
-        current_time = time.time()
-        if current_time - self.last_execution_time[event_name] >= self.min_interval:
+        # Raises KeyError for unregistered events so misspelled names stay visible
+        last_execution_time = self.last_execution_time[event_name]
+        current_time = time.monotonic()
+        if current_time - last_execution_time >= self.min_interval:
             self.trigger_event(event_name, *args, **kwargs)
             self.last_execution_time[event_name] = current_time
         else:
@@ -28,14 +31,17 @@ class EventBus:
                 self.pending_events[event_name] = (args, kwargs)
 
     async def trigger_event_after_delay(self, event_name, *args, **kwargs):
-        await asyncio.sleep(self.min_interval - (time.time() - self.last_execution_time[event_name]))
-        if event_name in self.pending_events:
-            args, kwargs = self.pending_events.pop(event_name)
+        await asyncio.sleep(self.min_interval - (time.monotonic() - self.last_execution_time[event_name]))
+        pending = self.pending_events.pop(event_name, None)
+        if pending is not None:
+            args, kwargs = pending
             self.trigger_event(event_name, *args, **kwargs)
-            self.last_execution_time[event_name] = time.time()
+            self.last_execution_time[event_name] = time.monotonic()
 
     def trigger_event(self, event_name, *args, **kwargs):
-        handlers = self.event_handlers.get(event_name, [])
+        handlers = self.event_handlers.get(event_name)
+        if not handlers:
+            return
+        loop = asyncio.get_event_loop()
         for handler in handlers:
-            loop = asyncio.get_event_loop()
             loop.create_task(handler(*args, **kwargs))
\ No newline at end of file
@@ -1,5 +1,4 @@
 import asyncio
-import json
 
 from datetime import datetime
 
@@ -10,7 +9,9 @@ from src.constants import ALPACA
 from .data_manager import DataManager
 from .api_handler import ApiHandler
 from .event_bus import EventBus
-from .error_handler import ErrorHandler
+from .error_handler import get_error_handler
+
+FETCH_DATA_START_DATE = datetime(2024, 1, 1)
 
 
 class GLaDOS:
@@ -20,11 +21,11 @@ class GLaDOS:
         self.data_manager = DataManager()
         self.api_handler = ApiHandler(self.veda)
         self.event_bus = EventBus(min_interval=6)
-        self.error_handler = ErrorHandler()
+        self.error_handler = get_error_handler()
         
         self.register_events()
         
-        self.running = True
+        self.stop_event = asyncio.Event()
 
     def register_events(self):
         self.event_bus.register_event("fetch_data", self.fetch_data_handler)
@@ -33,8 +34,7 @@ class GLaDOS:
         self.event_bus.register_event("submit_market_order", self.submit_market_order_handler)
 
     async def fetch_data_handler(self, symbol, sleepTime):
-        start_date = datetime.strptime("2024-01-01", "%Y-%m-%d")
-        data = await self.api_handler.get_stock_data(ALPACA, [symbol], start_date)
+        data = await self.api_handler.get_stock_data(ALPACA, [symbol], FETCH_DATA_START_DATE)
         print(f"Data for {symbol}:")
         print(data.df.head(20))
         #print(symbol)
@@ -77,11 +77,10 @@ class GLaDOS:
         self.event_bus.emit_event("assets_details", sleepTime=6)
         self.event_bus.emit_event("submit_market_order", sleepTime=6)
 
-        while self.running:
-            await asyncio.sleep(1)
+        await self.stop_event.wait()
 
     def stop(self):
-        self.running = False
+        self.stop_event.set()
 
     def process_request(self, request):  
         # Request process logic here
@@ -85,7 +85,7 @@ def get_nonce():
 
         Returns the string nonce.
     """
-    return str(int(1000*time.time()))
+    return str(time.time_ns() // 1000000)
 
 
 def get_account_assets():
@@ -109,10 +109,7 @@ def get_asset_info(assets=[]):
     """
     req_uri = GLOBAL_API_URI + '/0/public/Assets'
     if len(assets) > 0:
-        req_uri += '?asset='
-        for asset in assets:
-            req_uri += asset + ','
-        req_uri = req_uri[:-1]
+        req_uri += '?asset=' + ','.join(assets)
     resp = requests.get(req_uri)
     return resp.json()
 
@@ -128,10 +125,7 @@ def get_pairs(pairs=[]):
     """
     req_uri = GLOBAL_API_URI + '/0/public/AssetPairs'
     if len(pairs) > 0:
-        req_uri += '?pair='
-        for pair in pairs:
-            req_uri += pair + ','
-        req_uri = req_uri[:-1]
+        req_uri += '?pair=' + ','.join(pairs)
     resp = requests.get(req_uri)
     return resp.json()
 
@@ -159,16 +153,17 @@ def get_account_balance():
     balance = get_account_assets()['result']
     account_balance = 0
     for asset in balance:
+        amount = Decimal(balance[asset])
         if asset != 'ZUSD':
             order_book = get_order_book(asset + 'ZUSD')['result']
             asset_price = Decimal(order_book[asset + 'ZUSD']['asks'][0][0])
-            balance[asset] = {'amount': Decimal(balance[asset]),
-                              'value': Decimal(balance[asset]) * asset_price,
+            balance[asset] = {'amount': amount,
+                              'value': amount * asset_price,
                               'price': asset_price}
             account_balance += balance[asset]['value']
         else:
-            balance[asset] = {'amount': Decimal(balance[asset]),
-                              'value': Decimal(balance[asset]),
+            balance[asset] = {'amount': amount,
+                              'value': amount,
                               'price': 1}
             account_balance += balance[asset]['value']
     for asset in balance:
@@ -183,7 +178,7 @@ def add_order(ordertype, type, volume, pair, price=-1):
     log_string = "Placing {} {} {} order for {}".format(
         volume, ordertype, type, pair)
 
-    if ordertype in ['limit', 'stop-loss', 'stop-loss-limit', 'take-profit', 'take-profit-limit']:
+    if ordertype in {'limit', 'stop-loss', 'stop-loss-limit', 'take-profit', 'take-profit-limit'}:
         data["price"] = price
         log_string += " at {}".format(price)
 
@@ -221,7 +216,7 @@ def get_fear_greed_json():
 
 
 def get_fear_greed_index(fng_json):
-    return Decimal(1) - ((Decimal(fng_json['data'][0]['value']) - Decimal(GLOBAL_FNG_DEADZONE)) / Decimal(100 - (2 * GLOBAL_FNG_DEADZONE)))
+    return Decimal(1) - ((Decimal(fng_json['data'][0]['value']) - GLOBAL_FNG_DEADZONE_DECIMAL) / GLOBAL_FNG_RANGE)
 
 
 def get_fng_sleep_span(fng_json):
@@ -275,6 +270,8 @@ if __name__ == "__main__":
     GLOBAL_FNG_URI = "https://api.alternative.me/fng/"  # Fear and Greed Index api uri
     GLOBAL_API_KEY, GLOBAL_SECRET_KEY = get_env_json()
     GLOBAL_FNG_DEADZONE = 10
+    GLOBAL_FNG_DEADZONE_DECIMAL = Decimal(GLOBAL_FNG_DEADZONE)
+    GLOBAL_FNG_RANGE = Decimal(100 - (2 * GLOBAL_FNG_DEADZONE))  # Index span left after both deadzones
     GLOBAL_SLEEP_MIN = 300  # 300 sec, 5 min
     GLOBAL_SLEEP_MAX = 47800  # 47800 sec, 13hr
     GLOBAL_BALANCE_DIFF_THRESHOLD = Decimal(0.1)  # 10%
@@ -6,6 +6,9 @@ from alpaca.trading.requests import MarketOrderRequest, LimitOrderRequest, GetAs
 from alpaca.trading.enums import OrderSide, TimeInForce, AssetClass
 from alpaca.data.timeframe import TimeFrame
 
+# Fast path for the "BUY"/"buy" style spellings; any other casing falls back to OrderSide[side.upper()]
+_ORDER_SIDES = {key: side for side in OrderSide for key in (side.name, side.value)}
+
 class AlpacaApiHandler(BaseApiHandler):
     def __init__(self, api_key, api_secret):
         """Initializes the handler with trading and data clients using provided API credentials."""
@@ -51,10 +54,13 @@ class AlpacaApiHandler(BaseApiHandler):
     
     async def submit_market_order(self, symbol, qty, side, time_in_force=TimeInForce.GTC):
         """Submits a market order for a given symbol and quantity, specifying the side and time in force."""
+        order_side = _ORDER_SIDES.get(side)
+        if order_side is None:
+            order_side = OrderSide[side.upper()]  # Converts string parameter to OrderSide enum
         market_order_data = MarketOrderRequest(
                                 symbol=symbol,
                                 qty=qty,
-                                side=OrderSide[side.upper()],  # Converts string parameter to OrderSide enum
+                                side=order_side,
                                 time_in_force=time_in_force
                             )
         market_order = self.trading_client.submit_order(order_data=market_order_data)
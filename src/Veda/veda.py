@@ -16,37 +16,23 @@ class Veda:
             # Init other API handler...
         }
 
-    async def get_data(self, source, *args, **kwargs):
+    def _get_handler(self, source):
         handler = self.handlers.get(source)
-        if handler:
-            return await handler.get_data(*args, **kwargs)
-        else:
+        if handler is None:
             raise ValueError(f"API handler for {source} not found")
+        return handler
+
+    async def get_data(self, source, *args, **kwargs):
+        return await self._get_handler(source).get_data(*args, **kwargs)
 
     async def place_order(self, source, *args, **kwargs):
-        handler = self.handlers.get(source)
-        if handler:
-            return await handler.place_order(*args, **kwargs)
-        else:
-            raise ValueError(f"API handler for {source} not found")
-        
+        return await self._get_handler(source).place_order(*args, **kwargs)
+
     async def get_account_details(self, source, *args, **kwargs):
-        handler = self.handlers.get(source)
-        if handler:
-            return await handler.get_account_details(*args, **kwargs)
-        else:
-            raise ValueError(f"API handler for {source} not found")
-        
+        return await self._get_handler(source).get_account_details(*args, **kwargs)
+
     async def get_assets(self, source, *args, **kwargs):
-        handler = self.handlers.get(source)
-        if handler:
-            return await handler.get_assets(*args, **kwargs)
-        else:
-            raise ValueError(f"API handler for {source} not found")
-        
+        return await self._get_handler(source).get_assets(*args, **kwargs)
+
     async def submit_market_order(self, source, *args, **kwargs):
-        handler = self.handlers.get(source)
-        if handler:
-            return await handler.submit_market_order(*args, **kwargs)
-        else:
-            raise ValueError(f"API handler for {source} not found")
+        return await self._get_handler(source).submit_market_order(*args, **kwargs)
@@ -1,3 +1,4 @@
+import functools
 import os
 
 from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime
@@ -8,8 +9,6 @@ import datetime
 sql_user = os.getenv('POSTGRES_USER')
 sql_password = os.getenv('POSTGRES_PASSWORD')
 
-DATABASE_URL = "postgresql+psycopg2://"+sql_user+":"+sql_password+"@db:5432/weaverdb"
-
 Base = declarative_base()
 
 class TradeRecord(Base):
@@ -22,14 +21,21 @@ class TradeRecord(Base):
     price = Column(Float)
 
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@functools.lru_cache(maxsize=None)
+def get_engine():
+    # Created on first use so importing WallE does not need the database env
+    database_url = "postgresql+psycopg2://"+sql_user+":"+sql_password+"@db:5432/weaverdb"
+    return create_engine(database_url)
+
+@functools.lru_cache(maxsize=None)
+def get_session_factory():
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
 def init_db():
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 def create_trade_record(asset, volume, price):
-    with SessionLocal() as session:
+    with get_session_factory()() as session:
         new_record = TradeRecord(
             asset=asset,
             volume=volume,
@@ -38,9 +44,12 @@ def create_trade_record(asset, volume, price):
         session.add(new_record)
         session.commit()
 
-def get_trade_records():
-    with SessionLocal() as session:
-        records = session.query(TradeRecord).all()
+def get_trade_records(limit=None, offset=0):
+    with get_session_factory()() as session:
+        query = session.query(TradeRecord).order_by(TradeRecord.id).offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        records = query.all()
         for record in records:
             print(f"ID: {record.id}, Asset: {record.asset}, Volume: {record.volume}, Price: {record.price}")
 
@@ -1,6 +1,8 @@
 from typing import Dict
 
 class Trade:
+    __slots__ = ('symbol', 'price', 'size', 'timestamp')
+
     def __init__(self, symbol: str, price: float, size: float, timestamp: float):
         self.symbol = symbol
         self.price = price